@@ -1,12 +1,40 @@
 import pytest
-from unittest.mock import ANY
-from textwrap import dedent
+from pydantic import BaseModel
 
 # --- Import classes to be tested and mocked ---
 from windows_use.agent.registry.service import Registry
-from windows_use.agent.registry.views import Tool as ToolData, ToolResult
-from windows_use.desktop.service import Desktop
-from langchain.tools import Tool as LangchainTool
+from windows_use.agent.registry.views import ToolResult
+from windows_use.agent.desktop.service import Desktop
+from windows_use.tool import Tool
+
+
+class ToolInput(BaseModel):
+    param1: str
+
+
+class DesktopFieldInput(BaseModel):
+    """A schema whose dumped args carry a `desktop` key of their own."""
+    param1: str
+    desktop: str = "not a desktop"
+
+
+# The schema JSON ends flush-left, so dedent leaves the header lines indented
+EXPECTED_TEST_TOOL_PROMPT = (
+    "\n"
+    "        Tool Name: TestTool\n"
+    "        Tool Description: A test tool description.\n"
+    "        Tool Schema: {\n"
+    "    \"type\": \"object\",\n"
+    "    \"properties\": {\n"
+    "        \"param1\": {\n"
+    "            \"type\": \"string\"\n"
+    "        }\n"
+    "    },\n"
+    "    \"required\": [\n"
+    "        \"param1\"\n"
+    "    ]\n"
+    "}\n"
+)
 
 
 # #############################################################################
@@ -14,23 +42,19 @@ from langchain.tools import Tool as LangchainTool
 # #############################################################################
 
 @pytest.fixture
-def mock_langchain_tool(mocker):
-    """Provides a high-fidelity mock of a LangchainTool instance."""
-
-    # 1. Create the mock instance first using autospec.
-    #    This ensures it has the same methods as the real LangchainTool.
-    mock_tool = mocker.create_autospec(LangchainTool, instance=True)
-
-    # 2. Now, explicitly set the attributes that the production code will access.
-    #    autospec will allow this because the real LangchainTool has these attributes.
-    mock_tool.name = "TestTool"
-    mock_tool.description = "A test tool description."
-    mock_tool.args = {"param1": {"type": "str"}}
-    
-    # 3. Configure the mock's behavior.
-    mock_tool.run.return_value = "Tool executed successfully"
-    
-    return mock_tool
+def tool_function(mocker):
+    """Provides the mocked function wrapped by the test tool."""
+    return mocker.Mock(return_value="Tool executed successfully")
+
+@pytest.fixture
+def test_tool(tool_function):
+    """Provides a Tool instance backed by a mocked function."""
+    return Tool("TestTool", description="A test tool description.", args_schema=ToolInput)(tool_function)
+
+@pytest.fixture
+def other_tool(mocker):
+    """Provides a second Tool instance to check prompt ordering and joining."""
+    return Tool("OtherTool", description="Another test tool.", args_schema=ToolInput)(mocker.Mock(return_value="Other tool executed"))
 
 @pytest.fixture
 def mock_desktop(mocker):
@@ -38,9 +62,9 @@ def mock_desktop(mocker):
     return mocker.create_autospec(Desktop, instance=True)
 
 @pytest.fixture
-def registry_instance(mock_langchain_tool):
+def registry_instance(test_tool):
     """Provides a pre-initialized Registry instance for tests."""
-    return Registry(tools=[mock_langchain_tool])
+    return Registry(tools=[test_tool])
 
 
 # #############################################################################
@@ -50,48 +74,53 @@ def registry_instance(mock_langchain_tool):
 class TestRegistry:
     """Tests for the Registry service class."""
 
-    def test_init(self, registry_instance, mock_langchain_tool):
+    def test_init(self, registry_instance, test_tool):
         """
-        Tests that the Registry initializes correctly, creating ToolData objects.
+        Tests that the Registry initializes correctly, indexing tools by name.
         """
         # Assert
-        assert registry_instance.tools == [mock_langchain_tool]
-        assert "TestTool" in registry_instance.tools_registry
+        assert registry_instance.tools == [test_tool]
+        assert registry_instance.tools_registry == {"TestTool": test_tool}
+
+    def test_init_snapshots_tools(self, test_tool, other_tool):
+        """
+        Tests that mutating the caller's list after init does not leave the cached prompts stale.
+        """
+        # Arrange
+        tools = [test_tool]
+        registry = Registry(tools=tools)
 
-        tool_data = registry_instance.tools_registry["TestTool"]
-        assert isinstance(tool_data, ToolData)
-        assert tool_data.name == "TestTool"
-        assert tool_data.description == "A test tool description."
-        assert tool_data.params == {"param1": {"type": "str"}}
-        assert tool_data.function == mock_langchain_tool.run
+        # Act
+        tools.append(other_tool)
 
-    def test_get_tools_prompt(self, registry_instance):
+        # Assert
+        assert registry.tools == [test_tool]
+        assert registry.get_tools_prompt() == EXPECTED_TEST_TOOL_PROMPT
+        assert registry.tool_prompt("OtherTool") == "Tool 'OtherTool' not found."
+
+    def test_get_tools_prompt(self, test_tool, other_tool):
         """
-        Tests that the combined prompt for all tools is generated correctly.
+        Tests that the combined prompt joins the per-tool prompts in order.
         """
+        # Arrange
+        registry = Registry(tools=[test_tool, other_tool])
+
         # Act
-        prompt = registry_instance.get_tools_prompt()
+        prompt = registry.get_tools_prompt()
 
         # Assert
-        # Using .strip() to handle potential leading/trailing whitespace from dedent
-        expected = dedent("""
-        Available Tools:
-
-        Tool Name: TestTool
-        Description: A test tool description.
-        Parameters: {'param1': {'type': 'str'}}
-        """).strip()
-        assert prompt.strip() == expected
-    
+        assert prompt == EXPECTED_TEST_TOOL_PROMPT + "\n\n" + registry.tool_prompt("OtherTool")
+        assert "Tool Name: OtherTool" in registry.tool_prompt("OtherTool")
+
     @pytest.mark.parametrize(
-        "tool_name, expected_output_contains",
+        "tool_name, is_found",
         [
-            ("TestTool", "Tool Name: TestTool"),
-            ("NonExistentTool", "Tool 'NonExistentTool' not found."),
+            ("TestTool", True),
+            ("NonExistentTool", False),
         ],
         ids=["Tool Found", "Tool Not Found"]
     )
-    def test_tool_prompt(self, registry_instance, tool_name, expected_output_contains):
+    def test_tool_prompt(self, registry_instance, tool_name, is_found):
         """
         Tests `tool_prompt` for both found and not-found cases.
         """
@@ -99,7 +128,8 @@ class TestRegistry:
         prompt = registry_instance.tool_prompt(tool_name)
 
         # Assert
-        assert expected_output_contains in prompt
+        expected = EXPECTED_TEST_TOOL_PROMPT if is_found else f"Tool '{tool_name}' not found."
+        assert prompt == expected
 
     @pytest.mark.parametrize(
         "tool_name, tool_kwargs, run_side_effect, expected_result",
@@ -127,22 +157,37 @@ class TestRegistry:
             ),
         ]
     )
-    def test_execute(self, registry_instance, mock_langchain_tool, mock_desktop, tool_name, tool_kwargs, run_side_effect, expected_result):
+    def test_execute(self, registry_instance, tool_function, mock_desktop, tool_name, tool_kwargs, run_side_effect, expected_result):
         """
         Tests all execution paths of the `execute` method.
         """
         # Arrange
-        mock_langchain_tool.run.side_effect = run_side_effect
-        
+        tool_function.side_effect = run_side_effect
+
         # Act
         result = registry_instance.execute(tool_name, desktop=mock_desktop, **tool_kwargs)
-        
+
         # Assert
         assert result == expected_result
-        
-        # Also assert the mock was called correctly if the tool was supposed to be found
+
+        # Also assert the function was called correctly if the tool was supposed to be found
         if tool_name == "TestTool":
-            expected_tool_input = {"desktop": mock_desktop} | tool_kwargs
-            mock_langchain_tool.run.assert_called_once_with(tool_input=expected_tool_input)
+            tool_function.assert_called_once_with(desktop=mock_desktop, **tool_kwargs)
         else:
-            mock_langchain_tool.run.assert_not_called()
\ No newline at end of file
+            tool_function.assert_not_called()
+
+    def test_execute_rejects_desktop_in_args(self, tool_function, mock_desktop):
+        """
+        Tests that a `desktop` key in the validated args fails the call instead of overriding the Desktop.
+        """
+        # Arrange
+        tool = Tool("DesktopFieldTool", description="Dumps a desktop key.", args_schema=DesktopFieldInput)(tool_function)
+        registry = Registry(tools=[tool])
+
+        # Act
+        result = registry.execute("DesktopFieldTool", desktop=mock_desktop, param1="value1")
+
+        # Assert
+        assert result.is_success is False
+        assert "desktop" in result.error
+        tool_function.assert_not_called()
@@ -62,8 +62,8 @@ class Desktop:
         if active_app is not None and active_app in apps:
             apps.remove(active_app)
 
-        logger.debug(f"Active app: {active_app or 'No Active App Found'}")
-        logger.debug(f"Apps: {apps}")
+        logger.debug("Active app: %s", active_app or 'No Active App Found')
+        logger.debug("Apps: %s", apps)
         
         #Preparing handles for Tree
         other_apps_handles=list(controls_handles-apps_handles)
@@ -6,25 +6,30 @@ import json
 
 class Registry:
     def __init__(self,tools:list[Tool]=[]):
-        self.tools=tools
+        self.tools=list(tools)
         self.tools_registry=self.registry()
+        # Tools are fixed after init, so the prompts (and their schema JSON) are built only once
+        self._tool_prompts={name: self.build_tool_prompt(tool) for name,tool in self.tools_registry.items()}
+        self._tools_prompt='\n\n'.join(self._tool_prompts[tool.name] for tool in self.tools)
 
-    def tool_prompt(self, tool_name: str) -> str:
-        tool = self.tools_registry.get(tool_name)
-        if tool is None:
-            return f"Tool '{tool_name}' not found."
+    def build_tool_prompt(self, tool: Tool) -> str:
         return dedent(f"""
         Tool Name: {tool.name}
         Tool Description: {tool.description}
         Tool Schema: {json.dumps(tool.args_schema,indent=4)}
         """)
 
+    def tool_prompt(self, tool_name: str) -> str:
+        tool_prompt = self._tool_prompts.get(tool_name)
+        if tool_prompt is None:
+            return f"Tool '{tool_name}' not found."
+        return tool_prompt
+
     def registry(self):
         return {tool.name: tool for tool in self.tools}
     
     def get_tools_prompt(self) -> str:
-        tools_prompt = [self.tool_prompt(tool.name) for tool in self.tools]
-        return '\n\n'.join(tools_prompt)
+        return self._tools_prompt
     
     def execute(self, tool_name: str, desktop: Desktop|None=None, **kwargs) -> ToolResult:
         tool = self.tools_registry.get(tool_name)
@@ -32,7 +37,7 @@ class Registry:
             return ToolResult(is_success=False, error=f"Tool '{tool_name}' not found.")
         try:
             args=tool.model.model_validate(kwargs)
-            content = tool.invoke(**({'desktop': desktop} | args.model_dump()))
+            content = tool.invoke(desktop=desktop, **args.model_dump())
             return ToolResult(is_success=True, content=content)
         except Exception as error:
-            return ToolResult(is_success=False, error=str(error))
\ No newline at end of file
+            return ToolResult(is_success=False, error=str(error))
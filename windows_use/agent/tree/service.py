@@ -114,7 +114,7 @@ class Tree:
                             dom_informative_nodes.extend(info_nodes)
                     except Exception as e:
                         retry_counts[handle] += 1
-                        logger.debug(f"Error in processing handle {handle}, retry attempt {retry_counts[handle]}\nError: {e}")
+                        logger.debug("Error in processing handle %s, retry attempt %d\nError: %s", handle, retry_counts[handle], e)
                         if retry_counts[handle] < THREAD_MAX_RETRIES:
                             # Need to find is_browser again for retry
                             is_browser = next((ib for h, ib in task_inputs if h == handle), False)
@@ -495,12 +495,12 @@ class Tree:
             app_name=self.app_name_correction(app_name)
 
             self.tree_traversal(node, window_bounding_box, app_name, is_browser, interactive_nodes, scrollable_nodes, dom_interactive_nodes, dom_informative_nodes, is_dom=False, is_dialog=False, element_cache_req=element_cache_req, children_cache_req=children_cache_req)
-            logger.debug(f'App name:{app_name}')
-            logger.debug(f'Interactive nodes:{len(interactive_nodes)}')
+            logger.debug('App name:%s', app_name)
+            logger.debug('Interactive nodes:%d', len(interactive_nodes))
             if is_browser:
-                logger.debug(f'DOM interactive nodes:{len(dom_interactive_nodes)}')
-                logger.debug(f'DOM informative nodes:{len(dom_informative_nodes)}')
-            logger.debug(f'Scrollable nodes:{len(scrollable_nodes)}')
+                logger.debug('DOM interactive nodes:%d', len(dom_interactive_nodes))
+                logger.debug('DOM informative nodes:%d', len(dom_informative_nodes))
+            logger.debug('Scrollable nodes:%d', len(scrollable_nodes))
 
             interactive_nodes.extend(dom_interactive_nodes)
             return (interactive_nodes,scrollable_nodes,dom_informative_nodes)
@@ -512,6 +512,9 @@ class Tree:
 
     def _on_focus_change(self, sender:'ctypes.POINTER(IUIAutomationElement)'):
         """Handle focus change events."""
+        # The handler only logs, so skip the COM calls below when debug logging is off
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         # Debounce duplicate events
         current_time = time()
         element = Control.CreateControlFromElement(sender)
@@ -524,14 +527,16 @@ class Tree:
         self._last_focus_event = (event_key, current_time)
 
         try:
-            logger.debug(f"[WatchDog] Focus changed to: '{element.Name}' ({element.ControlTypeName})")
+            logger.debug("[WatchDog] Focus changed to: '%s' (%s)", element.Name, element.ControlTypeName)
         except Exception:
             pass
 
     def _on_property_change(self, sender:'ctypes.POINTER(IUIAutomationElement)', propertyId:int, newValue):
         """Handle property change events."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         try:
             element = Control.CreateControlFromElement(sender)
-            logger.debug(f"[WatchDog] Property changed: ID={propertyId} Value={newValue} Element: '{element.Name}' ({element.ControlTypeName})")
+            logger.debug("[WatchDog] Property changed: ID=%s Value=%s Element: '%s' (%s)", propertyId, newValue, element.Name, element.ControlTypeName)
         except Exception:
             pass
\ No newline at end of file